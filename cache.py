@@ -0,0 +1,69 @@
+# =============================================
+# FILE: cache.py (FastAPI) - Redis read-through cache
+# =============================================
+
+import os
+from typing import Optional
+
+import redis
+import redis.asyncio
+
+REDIS_URL = os.getenv("REDIS_URL", "redis://localhost:6379/0")
+
+PRODUCT_TTL = 300
+PRODUCT_LIST_TTL = 60
+ANALYSIS_TTL = 60
+
+redis_client = redis.asyncio.Redis.from_url(REDIS_URL, socket_connect_timeout=0.5, socket_timeout=0.5)
+
+
+# The cache is best-effort: if Redis is unreachable the API keeps serving from the database.
+async def cache_get(key: str) -> Optional[bytes]:
+    try:
+        return await redis_client.get(key)
+    except redis.RedisError:
+        return None
+
+async def cache_set(key: str, value, ttl: int):
+    try:
+        await redis_client.set(key, value, ex=ttl)
+    except redis.RedisError:
+        pass
+
+async def cache_delete(*keys: str):
+    try:
+        await redis_client.delete(*keys)
+    except redis.RedisError:
+        pass
+
+
+# =============================================
+# PRODUCT KEYS
+# =============================================
+# List pages are namespaced by a version number that is bumped on every write,
+# so invalidation never has to scan for keys.
+def product_key(product_id: int) -> str:
+    return f"product:{product_id}"
+
+async def product_list_key(skip: int, limit: int) -> str:
+    version = await cache_get("products:ver") or b"0"
+    return f"products:list:{version.decode()}:{skip}:{limit}"
+
+async def invalidate_product(product_id: int):
+    await cache_delete(product_key(product_id))
+    try:
+        await redis_client.incr("products:ver")
+    except redis.RedisError:
+        pass
+
+
+# =============================================
+# ANALYSIS KEYS
+# =============================================
+HIGHEST_SELLING_KEY = "analysis:highest_selling"
+
+def revenue_key(product_id: int) -> str:
+    return f"analysis:revenue:{product_id}"
+
+async def invalidate_analysis(*product_ids: int):
+    await cache_delete(HIGHEST_SELLING_KEY, *(revenue_key(product_id) for product_id in product_ids))
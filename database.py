@@ -2,12 +2,22 @@
 # FILE: database.py (FastAPI) - KEEP YOUR ORIGINAL
 # =============================================
 
-from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
 
-DATABASE_URL = "sqlite:///./ecommerce.db"
+DATABASE_URL = "sqlite+aiosqlite:///./ecommerce.db"
 
-engine = create_engine(DATABASE_URL, connect_args={"check_same_thread": False})
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# Sized for concurrent async handlers; the defaults (5 + 10 overflow) stall requests
+# waiting for a free connection under load.
+engine = create_async_engine(
+    DATABASE_URL,
+    poolclass=AsyncAdaptedQueuePool,
+    pool_size=20,
+    max_overflow=40,
+    pool_timeout=5,
+    pool_recycle=1800,
+    pool_pre_ping=True,
+)
+SessionLocal = async_sessionmaker(engine, autoflush=False, expire_on_commit=False)
 Base = declarative_base()
\ No newline at end of file
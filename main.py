@@ -3,21 +3,32 @@
 # =============================================
 
 import datetime
+import os
+from contextlib import asynccontextmanager
 from typing import List, Optional
 
+import orjson
 from fastapi import FastAPI, Depends, HTTPException, Query
-from fastapi.responses import JSONResponse
-from pydantic import BaseModel, Field
+from fastapi.responses import JSONResponse, Response, StreamingResponse
+from starlette.background import BackgroundTask
+from pydantic import BaseModel, Field, TypeAdapter
 from sqlalchemy import (Column, Integer, String, Float, Boolean, 
-                        Date, DateTime, ForeignKey, func)
-from sqlalchemy.orm import Session
+                        Date, DateTime, ForeignKey, Index, func, false, text,
+                        case, and_, exists, insert, lambda_stmt, select, update)
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import relationship, joinedload, selectinload
 
 # Assuming these files are correctly set up in your project
 from database import SessionLocal, engine, Base
+from cache import (cache_get, cache_set, product_key, product_list_key,
+                   invalidate_product, PRODUCT_TTL, PRODUCT_LIST_TTL,
+                   revenue_key, invalidate_analysis, HIGHEST_SELLING_KEY, ANALYSIS_TTL)
 from schemas import (ProductCreate, ProductUpdate, ProductResponse,
                    OrderCreate, OrderUpdate, OrderResponse,
                    MessageResponse, DjangoOrderResponse,
-                   CustomerCreate, CustomerResponse)
+                   CustomerCreate, CustomerResponse,
+                   BulkOrderUpdate, BulkOrderResponse)
 
 
 # =============================================
@@ -47,12 +58,12 @@ class Product(Base):
     __table_args__ = {'extend_existing': True}
     id = Column(Integer, primary_key=True, index=True)
     name = Column(String(100), nullable=False)
-    price = Column(Float, default=0)
-    category_id = Column(Integer, ForeignKey("store_category.id"), default=1)
-    description = Column(String(250), default="", nullable=True)
+    price = Column(Float, server_default="0")
+    category_id = Column(Integer, ForeignKey("store_category.id"), server_default="1", index=True)
+    description = Column(String(250), server_default="", nullable=True)
     image = Column(String(200), nullable=True)
-    is_sale = Column(Boolean, default=False)
-    sale_price = Column(Float, default=0)
+    is_sale = Column(Boolean, server_default=false())
+    sale_price = Column(Float, server_default="0")
 
 class Customer(Base):
     __tablename__ = "store_customer"
@@ -66,91 +77,137 @@ class Customer(Base):
 
 class Order(Base):
     __tablename__ = "store_order"
-    __table_args__ = {'extend_existing': True}
+    # (status, id) serves the shipped/unshipped lists, which filter on status and order by id
+    __table_args__ = (Index("ix_order_status_id", "status", "id"), {'extend_existing': True})
     id = Column(Integer, primary_key=True, index=True)
-    product_id = Column(Integer, ForeignKey("store_product.id"))
-    customer_id = Column(Integer, ForeignKey("store_customer.id"))
-    quantity = Column(Integer, default=1)
-    address = Column(String(100), default="", nullable=True)
-    phone = Column(String(20), default="", nullable=True)
-    date = Column(Date, default=datetime.date.today)
-    status = Column(Boolean, default=False)
+    product_id = Column(Integer, ForeignKey("store_product.id"), index=True)
+    customer_id = Column(Integer, ForeignKey("store_customer.id"), index=True)
+    quantity = Column(Integer, server_default="1")
+    address = Column(String(100), server_default="", nullable=True)
+    phone = Column(String(20), server_default="", nullable=True)
+    # Local date, matching date_shipped (datetime.now()); SQLite's CURRENT_DATE is UTC
+    date = Column(Date, server_default=text("(date('now', 'localtime'))"))
+    status = Column(Boolean, server_default=false())
     date_shipped = Column(DateTime, nullable=True)
 
+    # Many-to-one, so joined eager loading cannot multiply rows. Any future one-to-many
+    # child (e.g. order items) should use lazy="selectin" to avoid a cartesian product.
+    product = relationship("Product", lazy="joined")
+    customer = relationship("Customer", lazy="joined")
+
+
+# Schema is managed by Alembic (`alembic upgrade head`); set DEV_AUTOCREATE=1 to
+# create missing tables on startup for quick local runs.
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    if os.getenv("DEV_AUTOCREATE"):
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+    yield
+    await engine.dispose()
+
 
 # Create FastAPI app
 app = FastAPI(
     title="E-commerce API Backend",
     description="A focused API for managing products and orders for the Django front-end.",
-    version="2.0.0"
+    version="2.0.0",
+    lifespan=lifespan
 )
 
-# Create tables
-Base.metadata.create_all(bind=engine)
-
 # Database dependency
-def get_db():
-    db = SessionLocal()
-    try:
+async def get_db():
+    async with SessionLocal() as db:
         yield db
-    finally:
-        db.close()
 
 # Root endpoint
 @app.get("/", response_model=MessageResponse)
-def root():
+async def root():
     return {"message": "FastAPI E-commerce Backend is running"}
 
 
 # =============================================
 # PRODUCT ENDPOINTS (ALL INCLUDED)
 # =============================================
+# Hot read paths build their queries with lambda_stmt: the statement is constructed
+# and cache-keyed once per lambda, and later calls only bind the new parameter values.
+# List endpoints select plain columns instead of ORM instances (no identity map/state tracking).
+# The rows already match the response schemas, so they are wrapped with model_construct and
+# serialized once here; returning a Response skips FastAPI's response_model re-validation.
+product_list_adapter = TypeAdapter(List[ProductResponse])
+customer_list_adapter = TypeAdapter(List[CustomerResponse])
+
+PRODUCT_RESPONSE_COLUMNS = (Product.id, Product.name, Product.price, Product.category_id,
+                            Product.description, Product.image, Product.is_sale, Product.sale_price)
+
 @app.get("/products", response_model=List[ProductResponse], tags=["Products"])
-def get_products(skip: int = 0, limit: int = 100, db: Session = Depends(get_db)):
-    products = db.query(Product).offset(skip).limit(limit).all()
-    return products
+async def get_products(skip: int = 0, limit: int = 100, db: AsyncSession = Depends(get_db)):
+    key = await product_list_key(skip, limit)
+    cached = await cache_get(key)
+    if cached:
+        return Response(content=cached, media_type="application/json")
+
+    stmt = lambda_stmt(lambda: select(*PRODUCT_RESPONSE_COLUMNS))
+    stmt += lambda s: s.offset(skip).limit(limit)
+    rows = (await db.execute(stmt)).all()
+    body = product_list_adapter.dump_json([ProductResponse.model_construct(**row._mapping) for row in rows])
+    await cache_set(key, body, PRODUCT_LIST_TTL)
+    return Response(content=body, media_type="application/json")
 
 @app.get("/products/{product_id}", response_model=ProductResponse, tags=["Products"])
-def get_product(product_id: int, db: Session = Depends(get_db)):
-    product = db.query(Product).filter(Product.id == product_id).first()
+async def get_product(product_id: int, db: AsyncSession = Depends(get_db)):
+    cached = await cache_get(product_key(product_id))
+    if cached:
+        return ProductResponse.model_validate_json(cached)
+
+    product = await db.scalar(lambda_stmt(lambda: select(Product).where(Product.id == product_id)))
     if not product:
         raise HTTPException(status_code=404, detail="Product not found")
-    return product
+    response = ProductResponse.model_validate(product)
+    await cache_set(product_key(product_id), response.model_dump_json(), PRODUCT_TTL)
+    return response
 
 @app.post("/products", response_model=ProductResponse, status_code=201, tags=["Products"])
-def create_product(product: ProductCreate, db: Session = Depends(get_db)):
+async def create_product(product: ProductCreate, db: AsyncSession = Depends(get_db)):
     db_product = Product(**product.dict())
     db.add(db_product)
-    db.commit()
-    db.refresh(db_product)
+    await db.commit()
+    await db.refresh(db_product)
+    await invalidate_product(db_product.id)
     return db_product
 
 @app.put("/products/{product_id}", response_model=ProductResponse, tags=["Products"])
-def update_product(product_id: int, product: ProductUpdate, db: Session = Depends(get_db)):
-    db_product = db.query(Product).filter(Product.id == product_id).first()
+async def update_product(product_id: int, product: ProductUpdate, db: AsyncSession = Depends(get_db)):
+    db_product = await db.scalar(select(Product).where(Product.id == product_id))
     if not db_product:
         # If product doesn't exist, create it. This is an "upsert".
         new_product = Product(id=product_id, **product.dict())
         db.add(new_product)
-        db.commit()
-        db.refresh(new_product)
+        await db.commit()
+        await db.refresh(new_product)
+        await invalidate_product(product_id)
+        await invalidate_analysis(product_id)
         return new_product
 
     for key, value in product.dict(exclude_unset=True).items():
         setattr(db_product, key, value)
     
-    db.commit()
-    db.refresh(db_product)
+    await db.commit()
+    await db.refresh(db_product)
+    await invalidate_product(product_id)
+    await invalidate_analysis(product_id)
     return db_product
 
 @app.delete("/products/{product_id}", response_model=MessageResponse, tags=["Products"])
-def delete_product(product_id: int, db: Session = Depends(get_db)):
-    db_product = db.query(Product).filter(Product.id == product_id).first()
+async def delete_product(product_id: int, db: AsyncSession = Depends(get_db)):
+    db_product = await db.scalar(select(Product).where(Product.id == product_id))
     if not db_product:
         raise HTTPException(status_code=404, detail="Product not found")
     
-    db.delete(db_product)
-    db.commit()
+    await db.delete(db_product)
+    await db.commit()
+    await invalidate_product(product_id)
+    await invalidate_analysis(product_id)
     return {"message": f"Product {product_id} deleted successfully"}
 
 
@@ -158,34 +215,47 @@ def delete_product(product_id: int, db: Session = Depends(get_db)):
 # CUSTOMER ENDPOINTS
 # =============================================
 @app.get("/customers", response_model=List[CustomerResponse], tags=["Customers"])
-def get_customers(db: Session = Depends(get_db)):
-    customers = db.query(Customer).all()
-    return customers
+async def get_customers(db: AsyncSession = Depends(get_db)):
+    rows = (await db.execute(
+        select(Customer.id, Customer.first_name, Customer.last_name, Customer.phone, Customer.email)
+    )).all()
+    body = customer_list_adapter.dump_json([CustomerResponse.model_construct(**row._mapping) for row in rows])
+    return Response(content=body, media_type="application/json")
 
 @app.post("/customers", response_model=CustomerResponse, status_code=201, tags=["Customers"])
-def create_customer(customer: CustomerCreate, db: Session = Depends(get_db)):
-    existing = db.query(Customer).filter(Customer.email == customer.email).first()
-    if existing:
-        return existing
-    
-    db_customer = Customer(**customer.dict())
-    db.add(db_customer)
-    db.commit()
-    db.refresh(db_customer)
-    return db_customer
+async def create_customer(customer: CustomerCreate, db: AsyncSession = Depends(get_db)):
+    # Insert or return the existing customer with this email in one round-trip.
+    # The no-op DO UPDATE (rather than DO NOTHING) makes RETURNING yield the existing row.
+    stmt = sqlite_insert(Customer).values(**customer.dict())
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[Customer.email], set_={"email": stmt.excluded.email}
+    ).returning(Customer.id, Customer.first_name, Customer.last_name, Customer.phone, Customer.email)
+    row = (await db.execute(stmt)).first()
+    await db.commit()
+    return CustomerResponse(**row._mapping)
 
 
 # =============================================
 # HELPER FUNCTION (Used by Order Endpoints)
 # =============================================
-def enrich_order_details(order: Order, db: Session):
-    product = db.query(Product).filter(Product.id == order.product_id).first()
-    customer = db.query(Customer).filter(Customer.id == order.customer_id).first()
+def effective_price(product: Product) -> float:
+    return product.sale_price if product.is_sale and product.sale_price > 0 else product.price
+
+def enrich_order_details(order: Order, price_map: Optional[dict] = None):
+    # Expects order.product and order.customer to be eager loaded by the caller.
+    # List endpoints pass a shared price_map so each product's price is worked out once per request.
+    product = order.product
+    customer = order.customer
     
     if not product or not customer:
         return None
     
-    price = product.sale_price if product.is_sale and product.sale_price > 0 else product.price
+    if price_map is None:
+        price = effective_price(product)
+    else:
+        price = price_map.get(order.product_id)
+        if price is None:
+            price = price_map[order.product_id] = effective_price(product)
     amount_paid = float(price) * order.quantity
     
     return {
@@ -209,49 +279,84 @@ def enrich_order_details(order: Order, db: Session):
 # ORDER ENDPOINTS
 # =============================================
 @app.get("/orders", response_model=List[DjangoOrderResponse], tags=["Orders"])
-def get_all_orders(
+async def get_all_orders(
     skip: int = 0, 
     limit: int = 100, 
-    shipped: Optional[bool] = None,
-    db: Session = Depends(get_db)
+    shipped: Optional[bool] = None
 ):
-    query = db.query(Order).order_by(Order.id.desc())
+    query = lambda_stmt(lambda: (
+        select(Order)
+        .options(
+            joinedload(Order.product).load_only(Product.name, Product.price, Product.is_sale, Product.sale_price),
+            joinedload(Order.customer).load_only(Customer.first_name, Customer.last_name, Customer.email),
+        )
+        .order_by(Order.id.desc())
+    ))
     if shipped is not None:
-        query = query.filter(Order.status == shipped)
-    
-    orders = query.offset(skip).limit(limit).all()
-    
-    response_list = [enrich_order_details(order, db) for order in orders]
-    return [res for res in response_list if res is not None]
+        query += lambda s: s.where(Order.status == shipped)
+    query += lambda s: s.offset(skip).limit(limit)
+
+    # Rows are fetched in batches and written out as they are formatted, so a large
+    # page is never held in memory as a whole. The query runs here, before the 200
+    # is sent, so database errors still surface as a 500; the session outlives this
+    # handler and is closed once the body has been streamed.
+    db = SessionLocal()
+    try:
+        orders = await db.stream_scalars(query, execution_options={"yield_per": 200})
+    except Exception:
+        await db.close()
+        raise
+
+    async def stream_orders():
+        try:
+            price_map = {}
+            separator = b"["
+            async for order in orders:
+                enriched = enrich_order_details(order, price_map)
+                if enriched is None:
+                    continue
+                yield separator + orjson.dumps(enriched)
+                separator = b","
+            yield b"[]" if separator == b"[" else b"]"
+        finally:
+            await db.close()
+
+    # The background task also closes the session if the stream is never started
+    return StreamingResponse(stream_orders(), media_type="application/json", background=BackgroundTask(db.close))
 
 @app.get("/orders/{order_id}", response_model=DjangoOrderResponse, tags=["Orders"])
-def get_order(order_id: int, db: Session = Depends(get_db)):
-    order = db.query(Order).filter(Order.id == order_id).first()
+async def get_order(order_id: int, db: AsyncSession = Depends(get_db)):
+    order = await db.scalar(lambda_stmt(lambda: (
+        select(Order)
+        .options(joinedload(Order.product), joinedload(Order.customer))
+        .where(Order.id == order_id)
+    )))
     if not order:
         raise HTTPException(status_code=404, detail="Order not found")
     
-    enriched = enrich_order_details(order, db)
+    enriched = enrich_order_details(order)
     if not enriched:
         raise HTTPException(status_code=404, detail="Associated product or customer not found for this order")
     
     return enriched
 
 @app.post("/orders", response_model=OrderResponse, status_code=201, tags=["Orders"])
-def create_order(order: OrderCreate, db: Session = Depends(get_db)):
-    product = db.query(Product).filter(Product.id == order.product_id).first()
+async def create_order(order: OrderCreate, db: AsyncSession = Depends(get_db)):
+    product = await db.get(Product, order.product_id)
     if not product:
         raise HTTPException(status_code=404, detail=f"Product with ID {order.product_id} not found")
     
-    customer = db.query(Customer).filter(Customer.id == order.customer_id).first()
+    customer = await db.get(Customer, order.customer_id)
     if not customer:
         raise HTTPException(status_code=404, detail="Customer not found")
 
     db_order = Order(**order.dict())
     db.add(db_order)
-    db.commit()
-    db.refresh(db_order)
+    await db.commit()
+    await db.refresh(db_order)
+    await invalidate_analysis(db_order.product_id)
 
-    price = product.sale_price if product.is_sale and product.sale_price > 0 else product.price
+    price = effective_price(product)
     amount_paid = float(price) * db_order.quantity
 
     return OrderResponse(
@@ -262,11 +367,35 @@ def create_order(order: OrderCreate, db: Session = Depends(get_db)):
         amount_paid=amount_paid, customer_email=customer.email
     )
 
+# Registered before /orders/{order_id} so "bulk" is not parsed as an order id
+@app.put("/orders/bulk", response_model=BulkOrderResponse, tags=["Orders"])
+async def bulk_update_orders(body: BulkOrderUpdate, db: AsyncSession = Depends(get_db)):
+    # Same shipping rules as update_order: keep an existing ship date, clear it when unshipped
+    date_shipped = func.coalesce(Order.date_shipped, datetime.datetime.now()) if body.status else None
+    result = await db.execute(
+        update(Order)
+        .where(Order.id.in_(body.order_ids))
+        .values(status=body.status, date_shipped=date_shipped)
+        .execution_options(synchronize_session=False)
+    )
+    await db.commit()
+    return BulkOrderResponse(
+        updated_count=result.rowcount,
+        message=f"{result.rowcount} orders marked as {'shipped' if body.status else 'unshipped'}",
+        order_ids=body.order_ids
+    )
+
 @app.put("/orders/{order_id}", response_model=DjangoOrderResponse, tags=["Orders"])
-def update_order(order_id: int, order: OrderUpdate, db: Session = Depends(get_db)):
-    db_order = db.query(Order).filter(Order.id == order_id).first()
+async def update_order(order_id: int, order: OrderUpdate, db: AsyncSession = Depends(get_db)):
+    order_query = (
+        select(Order)
+        .options(joinedload(Order.product), joinedload(Order.customer))
+        .where(Order.id == order_id)
+    )
+    db_order = await db.scalar(order_query)
     if not db_order:
         raise HTTPException(status_code=404, detail="Order not found")
+    previous_product_id = db_order.product_id
     
     update_data = order.dict(exclude_unset=True)
     for key, value in update_data.items():
@@ -277,34 +406,50 @@ def update_order(order_id: int, order: OrderUpdate, db: Session = Depends(get_db
                 db_order.date_shipped = None
         setattr(db_order, key, value)
     
-    db.commit()
-    db.refresh(db_order)
+    await db.commit()
+    # Reload instead of refresh(): product_id/customer_id may have changed and
+    # relationships cannot be lazy loaded on an AsyncSession.
+    db_order = await db.scalar(order_query.execution_options(populate_existing=True))
+    await invalidate_analysis(previous_product_id, db_order.product_id)
     
-    return enrich_order_details(db_order, db)
+    return enrich_order_details(db_order)
 
 @app.delete("/orders/{order_id}", response_model=MessageResponse, tags=["Orders"])
-def delete_order(order_id: int, db: Session = Depends(get_db)):
-    db_order = db.query(Order).filter(Order.id == order_id).first()
+async def delete_order(order_id: int, db: AsyncSession = Depends(get_db)):
+    db_order = await db.scalar(select(Order).where(Order.id == order_id))
     if not db_order:
         raise HTTPException(status_code=404, detail="Order not found")
-    db.delete(db_order)
-    db.commit()
+    await db.delete(db_order)
+    await db.commit()
+    await invalidate_analysis(db_order.product_id)
     return {"message": f"Order {order_id} deleted successfully"}
 
 
 # =============================================
 # LEGACY ENDPOINTS
 # =============================================
+# These lists are unpaginated, so products/customers are fetched once per
+# distinct id with a single IN (...) query each instead of being joined per row.
 @app.get("/orders-shipped", response_model=List[DjangoOrderResponse], tags=["Legacy Orders"])
-def get_orders_shipped(db: Session = Depends(get_db)):
-    shipped_orders = db.query(Order).filter(Order.status == True).all()
-    response = [enrich_order_details(order, db) for order in shipped_orders]
+async def get_orders_shipped(db: AsyncSession = Depends(get_db)):
+    shipped_orders = (await db.scalars(
+        select(Order)
+        .options(selectinload(Order.product), selectinload(Order.customer))
+        .where(Order.status == True)
+    )).all()
+    price_map = {}
+    response = [enrich_order_details(order, price_map) for order in shipped_orders]
     return [res for res in response if res is not None]
 
 @app.get("/orders-unshipped", response_model=List[DjangoOrderResponse], tags=["Legacy Orders"])
-def get_orders_unshipped(db: Session = Depends(get_db)):
-    unshipped_orders = db.query(Order).filter(Order.status == False).all()
-    response = [enrich_order_details(order, db) for order in unshipped_orders]
+async def get_orders_unshipped(db: AsyncSession = Depends(get_db)):
+    unshipped_orders = (await db.scalars(
+        select(Order)
+        .options(selectinload(Order.product), selectinload(Order.customer))
+        .where(Order.status == False)
+    )).all()
+    price_map = {}
+    response = [enrich_order_details(order, price_map) for order in unshipped_orders]
     return [res for res in response if res is not None]
 
 
@@ -312,64 +457,82 @@ def get_orders_unshipped(db: Session = Depends(get_db)):
 # ANALYSIS ENDPOINTS
 # =============================================
 @app.get("/analysis/revenue/{product_id}", response_model=ProductAnalysisResponse, tags=["Analysis"])
-def get_total_revenue_per_product(product_id: int, db: Session = Depends(get_db)):
-    product = db.query(Product).filter(Product.id == product_id).first()
+async def get_total_revenue_per_product(product_id: int, db: AsyncSession = Depends(get_db)):
+    cached = await cache_get(revenue_key(product_id))
+    if cached:
+        return ProductAnalysisResponse.model_validate_json(cached)
+
+    product = await db.scalar(select(Product).where(Product.id == product_id))
     if not product:
         raise HTTPException(status_code=404, detail=f"Product with ID {product_id} not found")
-    orders = db.query(Order).filter(Order.product_id == product_id).all()
-    total_revenue = 0.0
-    total_quantity = 0
-    for order in orders:
-        price = product.sale_price if product.is_sale and product.sale_price > 0 else product.price
-        total_revenue += order.quantity * price
-        total_quantity += order.quantity
-    return {"product_id": product_id, "product_name": product.name, "total_revenue": total_revenue, "total_quantity_sold": total_quantity}
+    total_quantity = await db.scalar(select(func.coalesce(func.sum(Order.quantity), 0)).where(Order.product_id == product_id))
+    price = effective_price(product)
+    total_revenue = float(price) * total_quantity
+    response = ProductAnalysisResponse(product_id=product_id, product_name=product.name, total_revenue=total_revenue, total_quantity_sold=total_quantity)
+    await cache_set(revenue_key(product_id), response.model_dump_json(), ANALYSIS_TTL)
+    return response
 
 @app.get("/analysis/highest-selling", response_model=ProductAnalysisResponse, tags=["Analysis"])
-def get_highest_selling_product(db: Session = Depends(get_db)):
-    top_selling = db.query(Order.product_id, func.sum(Order.quantity).label("total_quantity")).group_by(Order.product_id).order_by(func.sum(Order.quantity).desc()).first()
+async def get_highest_selling_product(db: AsyncSession = Depends(get_db)):
+    cached = await cache_get(HIGHEST_SELLING_KEY)
+    if cached:
+        return ProductAnalysisResponse.model_validate_json(cached)
+
+    price_expr = case((and_(Product.is_sale == True, Product.sale_price > 0), Product.sale_price), else_=Product.price)
+    top_selling = (await db.execute(
+        select(
+            Product.id,
+            Product.name,
+            func.sum(Order.quantity * price_expr).label("total_revenue"),
+            func.sum(Order.quantity).label("total_quantity"),
+        )
+        .join(Order, Order.product_id == Product.id)
+        .group_by(Product.id, Product.name)
+        .order_by(func.sum(Order.quantity).desc())
+        .limit(1)
+    )).first()
     if not top_selling:
         raise HTTPException(status_code=404, detail="No sales data found")
-    product = db.query(Product).filter(Product.id == top_selling.product_id).first()
-    if not product:
-        raise HTTPException(status_code=404, detail=f"Product with ID {top_selling.product_id} not found")
-    orders = db.query(Order).filter(Order.product_id == product.id).all()
-    total_revenue = 0.0
-    for order in orders:
-        price = product.sale_price if product.is_sale and product.sale_price > 0 else product.price
-        total_revenue += order.quantity * price
-    return {"product_id": product.id, "product_name": product.name, "total_revenue": total_revenue, "total_quantity_sold": top_selling.total_quantity}
+    response = ProductAnalysisResponse(product_id=top_selling.id, product_name=top_selling.name, total_revenue=top_selling.total_revenue, total_quantity_sold=top_selling.total_quantity)
+    await cache_set(HIGHEST_SELLING_KEY, response.model_dump_json(), ANALYSIS_TTL)
+    return response
 
 
 # =============================================
 # UTILITY ENDPOINT TO ADD DATA
 # =============================================
-@app.post("/create-sample-data", tags=["Utility"])
-def create_sample_data(db: Session = Depends(get_db)):
-    if db.query(Order).first():
+@app.post("/create-sample-data", response_model=MessageResponse, tags=["Utility"])
+async def create_sample_data(db: AsyncSession = Depends(get_db)):
+    if await db.scalar(select(exists().select_from(Order))):
         return {"message": "Sample data already exists."}
 
-    sample_category = Category(name="Sample Category")
-    db.add(sample_category)
-    db.commit()
-    db.refresh(sample_category)
-
-    sample_customer = Customer(first_name="John", last_name="Doe", email="john.doe@example.com", password="password")
-    db.add(sample_customer)
-    db.commit()
-    db.refresh(sample_customer)
-
-    prod1 = Product(name="Sample Unshipped Product", price=29.99, category_id=sample_category.id)
-    prod2 = Product(name="Sample Shipped Product", price=49.99, category_id=sample_category.id)
-    db.add_all([prod1, prod2])
-    db.commit()
-    db.refresh(prod1)
-    db.refresh(prod2)
-
-    order1 = Order(product_id=prod1.id, customer_id=sample_customer.id, quantity=2, address="123 Main St", status=False)
-    order2 = Order(product_id=prod2.id, customer_id=sample_customer.id, quantity=1, address="456 Oak Ave", status=True, date_shipped=datetime.datetime.now())
-    db.add_all([order1, order2])
-    db.commit()
+    # One INSERT per table; ids come back through RETURNING so no refresh round-trips are needed
+    category_id = await db.scalar(insert(Category).values(name="Sample Category").returning(Category.id))
+    customer_id = await db.scalar(
+        insert(Customer)
+        .values(first_name="John", last_name="Doe", email="john.doe@example.com", password="password")
+        .returning(Customer.id)
+    )
+
+    unshipped_product_id, shipped_product_id = (await db.scalars(
+        insert(Product).returning(Product.id, sort_by_parameter_order=True),
+        [
+            {"name": "Sample Unshipped Product", "price": 29.99, "category_id": category_id},
+            {"name": "Sample Shipped Product", "price": 49.99, "category_id": category_id},
+        ],
+    )).all()
+
+    await db.execute(
+        insert(Order),
+        [
+            {"product_id": unshipped_product_id, "customer_id": customer_id, "quantity": 2, "address": "123 Main St", "status": False},
+            {"product_id": shipped_product_id, "customer_id": customer_id, "quantity": 1, "address": "456 Oak Ave", "status": True, "date_shipped": datetime.datetime.now()},
+        ],
+    )
+    await db.commit()
+    for product_id in (unshipped_product_id, shipped_product_id):
+        await invalidate_product(product_id)
+    await invalidate_analysis(unshipped_product_id, shipped_product_id)
     
     return {"message": "Sample data created successfully!"}
 
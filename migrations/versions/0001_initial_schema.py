@@ -0,0 +1,77 @@
+"""initial schema
+
+The store_* tables may already exist (created by create_all or shared with the
+Django front-end), so each table is only created when missing.
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-15
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0001"
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    existing = set(sa.inspect(op.get_bind()).get_table_names())
+
+    if "store_category" not in existing:
+        op.create_table(
+            "store_category",
+            sa.Column("id", sa.Integer(), primary_key=True),
+            sa.Column("name", sa.String(50), nullable=False),
+        )
+        op.create_index("ix_store_category_id", "store_category", ["id"])
+
+    if "store_product" not in existing:
+        op.create_table(
+            "store_product",
+            sa.Column("id", sa.Integer(), primary_key=True),
+            sa.Column("name", sa.String(100), nullable=False),
+            sa.Column("price", sa.Float()),
+            sa.Column("category_id", sa.Integer(), sa.ForeignKey("store_category.id")),
+            sa.Column("description", sa.String(250), nullable=True),
+            sa.Column("image", sa.String(200), nullable=True),
+            sa.Column("is_sale", sa.Boolean()),
+            sa.Column("sale_price", sa.Float()),
+        )
+        op.create_index("ix_store_product_id", "store_product", ["id"])
+
+    if "store_customer" not in existing:
+        op.create_table(
+            "store_customer",
+            sa.Column("id", sa.Integer(), primary_key=True),
+            sa.Column("first_name", sa.String(50)),
+            sa.Column("last_name", sa.String(50)),
+            sa.Column("phone", sa.String(20), nullable=True),
+            sa.Column("email", sa.String(100), unique=True),
+            sa.Column("password", sa.String(100)),
+        )
+        op.create_index("ix_store_customer_id", "store_customer", ["id"])
+
+    if "store_order" not in existing:
+        op.create_table(
+            "store_order",
+            sa.Column("id", sa.Integer(), primary_key=True),
+            sa.Column("product_id", sa.Integer(), sa.ForeignKey("store_product.id")),
+            sa.Column("customer_id", sa.Integer(), sa.ForeignKey("store_customer.id")),
+            sa.Column("quantity", sa.Integer()),
+            sa.Column("address", sa.String(100), nullable=True),
+            sa.Column("phone", sa.String(20), nullable=True),
+            sa.Column("date", sa.Date()),
+            sa.Column("status", sa.Boolean()),
+            sa.Column("date_shipped", sa.DateTime(), nullable=True),
+        )
+        op.create_index("ix_store_order_id", "store_order", ["id"])
+
+
+def downgrade():
+    # upgrade() does not record which tables it created, and existing store_* tables
+    # hold live (possibly Django-owned) data, so never drop them here.
+    raise RuntimeError(
+        "Downgrading past 0001 would drop the store_* tables; drop them manually if that is intended."
+    )
@@ -0,0 +1,26 @@
+"""index order/product filter and join columns
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-15
+"""
+from alembic import op
+
+revision = "0002"
+down_revision = "0001"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index("ix_store_order_product_id", "store_order", ["product_id"], if_not_exists=True)
+    op.create_index("ix_store_order_customer_id", "store_order", ["customer_id"], if_not_exists=True)
+    op.create_index("ix_order_status_id", "store_order", ["status", "id"], if_not_exists=True)
+    op.create_index("ix_store_product_category_id", "store_product", ["category_id"], if_not_exists=True)
+
+
+def downgrade():
+    op.drop_index("ix_store_product_category_id", table_name="store_product")
+    op.drop_index("ix_order_status_id", table_name="store_order")
+    op.drop_index("ix_store_order_customer_id", table_name="store_order")
+    op.drop_index("ix_store_order_product_id", table_name="store_order")
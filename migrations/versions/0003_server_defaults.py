@@ -0,0 +1,41 @@
+"""move product/order column defaults to the database
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-15
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0003"
+down_revision = "0002"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table("store_product") as batch_op:
+        batch_op.alter_column("price", existing_type=sa.Float(), server_default="0")
+        batch_op.alter_column("category_id", existing_type=sa.Integer(), server_default="1")
+        batch_op.alter_column("description", existing_type=sa.String(250), server_default="")
+        batch_op.alter_column("is_sale", existing_type=sa.Boolean(), server_default=sa.false())
+        batch_op.alter_column("sale_price", existing_type=sa.Float(), server_default="0")
+
+    with op.batch_alter_table("store_order") as batch_op:
+        batch_op.alter_column("quantity", existing_type=sa.Integer(), server_default="1")
+        batch_op.alter_column("address", existing_type=sa.String(100), server_default="")
+        batch_op.alter_column("phone", existing_type=sa.String(20), server_default="")
+        batch_op.alter_column("date", existing_type=sa.Date(), server_default=sa.func.current_date())
+        batch_op.alter_column("status", existing_type=sa.Boolean(), server_default=sa.false())
+
+
+def downgrade():
+    with op.batch_alter_table("store_order") as batch_op:
+        for column, type_ in (("quantity", sa.Integer()), ("address", sa.String(100)), ("phone", sa.String(20)),
+                              ("date", sa.Date()), ("status", sa.Boolean())):
+            batch_op.alter_column(column, existing_type=type_, server_default=None)
+
+    with op.batch_alter_table("store_product") as batch_op:
+        for column, type_ in (("price", sa.Float()), ("category_id", sa.Integer()), ("description", sa.String(250)),
+                              ("is_sale", sa.Boolean()), ("sale_price", sa.Float())):
+            batch_op.alter_column(column, existing_type=type_, server_default=None)
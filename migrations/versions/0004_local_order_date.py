@@ -0,0 +1,26 @@
+"""default store_order.date to the local date
+
+SQLite's CURRENT_DATE is UTC, while date_shipped is written from the server's
+local datetime.now(), so the order date could be a day off from the ship date.
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-15
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0004"
+down_revision = "0003"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table("store_order") as batch_op:
+        batch_op.alter_column("date", existing_type=sa.Date(), server_default=sa.text("(date('now', 'localtime'))"))
+
+
+def downgrade():
+    with op.batch_alter_table("store_order") as batch_op:
+        batch_op.alter_column("date", existing_type=sa.Date(), server_default=sa.func.current_date())
@@ -2,8 +2,8 @@
 # FILE: schemas.py - Pydantic Models for FastAPI
 # =============================================
 
-from pydantic import BaseModel, EmailStr
-from typing import List, Optional, Dict, Any
+from pydantic import BaseModel, StringConstraints
+from typing import Annotated, List, Optional, Dict, Any
 from datetime import date, datetime
 
 # =============================================
@@ -64,11 +64,15 @@ class ProductResponse(ProductBase):
 # CUSTOMER SCHEMAS
 # =============================================
 
+# Cheap structural check instead of EmailStr: email-validator's full parse is
+# noticeable on the hot signup path and stricter than this internal API needs.
+Email = Annotated[str, StringConstraints(pattern=r"^[^@\s]+@[^@\s]+\.[^@\s]+$", max_length=100)]
+
 class CustomerBase(BaseModel):
     first_name: str
     last_name: str
     phone: Optional[str] = None
-    email: EmailStr
+    email: Email
     password: str
 
 class CustomerCreate(CustomerBase):